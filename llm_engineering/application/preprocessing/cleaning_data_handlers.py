@@ -30,6 +30,11 @@ class CleaningDataHandler(ABC, Generic[DocumentT, CleanedDocumentT]):
     def clean(self, data_model: DocumentT) -> CleanedDocumentT:
         pass
 
+    # Cleans a homogeneous batch of documents in one call. Handlers are instantiated once per batch,
+    # so any setup they do (e.g., compiling regexes) is amortized across the whole batch instead of being paid per document.
+    def clean_batch(self, data_models: list[DocumentT]) -> list[CleanedDocumentT]:
+        return [self.clean(data_model) for data_model in data_models]
+
 
 class PostCleaningHandler(CleaningDataHandler):
     def clean(self, data_model: PostDocument) -> CleanedPostDocument:
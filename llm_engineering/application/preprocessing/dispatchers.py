@@ -1,6 +1,16 @@
+from collections import defaultdict
+
 from loguru import logger
 
 from llm_engineering.domain.base import NoSQLBaseDocument, VectorBaseDocument
+from llm_engineering.domain.chunks import ArticleChunk, PostChunk, RepositoryChunk
+from llm_engineering.domain.cleaned_documents import (
+    CleanedArticleDocument,
+    CleanedPostDocument,
+    CleanedRepositoryDocument,
+)
+from llm_engineering.domain.documents import ArticleDocument, PostDocument, RepositoryDocument
+from llm_engineering.domain.queries import Query
 from llm_engineering.domain.types import DataCategory
 
 from .chunking_data_handlers import (
@@ -26,18 +36,33 @@ from .embedding_data_handlers import (
 # A dispatcher inputs a document and applies dedicated handlers based on its data category (article, post, or repository). A handler can either clean, chunk, or embed a document.
 # The CleaningDispatcher implements a dispatch() method that inputs a raw document. Based on its data category, 
 # it instantiates and calls a handler that applies the cleaning logic specific to that data point.
-# The key in the dispatcher logic is the CleaningHandlerFactory(), which instantiates a different cleaning handler based on the document’s data category:
+# The key in the dispatcher logic is the CleaningHandlerFactory(), which resolves a different cleaning handler based on the document’s data category.
+# The handlers are stateless, so we build each of them once at import time and dispatch through a dict lookup
+# instead of allocating a fresh handler and walking an if/elif ladder for every single document:
+_CLEANING_HANDLERS: dict[DataCategory, CleaningDataHandler] = {
+    DataCategory.POSTS: PostCleaningHandler(),
+    DataCategory.ARTICLES: ArticleCleaningHandler(),
+    DataCategory.REPOSITORIES: RepositoryCleaningHandler(),
+}
+
+# The same singletons, bound directly to the document classes they handle. Resolving the handler from the
+# model's class at dispatch time is a single dict hit — no data category round trip, no branching:
+_CLEANING_HANDLER_BY_CLASS: dict[type[NoSQLBaseDocument], CleaningDataHandler] = {
+    PostDocument: _CLEANING_HANDLERS[DataCategory.POSTS],
+    ArticleDocument: _CLEANING_HANDLERS[DataCategory.ARTICLES],
+    RepositoryDocument: _CLEANING_HANDLERS[DataCategory.REPOSITORIES],
+}
+
+
+# Kept as a shim for callers that still resolve handlers by data category;
+# the dispatchers below now bind handlers by document class instead:
 class CleaningHandlerFactory:
     @staticmethod
     def create_handler(data_category: DataCategory) -> CleaningDataHandler:
-        if data_category == DataCategory.POSTS:
-            return PostCleaningHandler()
-        elif data_category == DataCategory.ARTICLES:
-            return ArticleCleaningHandler()
-        elif data_category == DataCategory.REPOSITORIES:
-            return RepositoryCleaningHandler()
-        else:
-            raise ValueError("Unsupported data type")
+        try:
+            return _CLEANING_HANDLERS[data_category]
+        except KeyError:
+            raise ValueError("Unsupported data type") from None
 
 
 class CleaningDispatcher:
@@ -45,33 +70,76 @@ class CleaningDispatcher:
 
     @classmethod
     def dispatch(cls, data_model: NoSQLBaseDocument) -> VectorBaseDocument:
-        data_category = DataCategory(data_model.get_collection_name())
-        handler = cls.factory.create_handler(data_category)
+        handler = _CLEANING_HANDLER_BY_CLASS.get(type(data_model))
+        if handler is None:
+            raise ValueError("Unsupported data type")
+
         clean_model = handler.clean(data_model)
 
-        logger.info(
+        # Per-document logs are debug-only: formatting an INFO record per document adds measurable
+        # interpreter work on 100k-document runs. dispatch_batch() emits one aggregate INFO per group instead.
+        logger.debug(
             "Document cleaned successfully.",
-            data_category=data_category,
+            data_category=clean_model.get_category(),
             cleaned_content_len=len(clean_model.content),
         )
 
         return clean_model
 
+    # The batched twin of dispatch(). Instead of resolving a handler and logging once per document,
+    # it groups the documents by class, resolves each handler once per group and cleans every group in a single clean_batch() call.
+    # This mirrors how the EmbeddingDispatcher already processes homogeneous batches.
+    @classmethod
+    def dispatch_batch(cls, data_models: list[NoSQLBaseDocument]) -> list[VectorBaseDocument]:
+        grouped_data_models = defaultdict(list)
+        for data_model in data_models:
+            grouped_data_models[type(data_model)].append(data_model)
+
+        clean_models = []
+        for model_class, group in grouped_data_models.items():
+            handler = _CLEANING_HANDLER_BY_CLASS.get(model_class)
+            if handler is None:
+                raise ValueError("Unsupported data type")
+
+            cleaned_group = handler.clean_batch(group)
+            clean_models.extend(cleaned_group)
+
+            logger.info(
+                "Documents cleaned successfully.",
+                data_category=DataCategory(model_class.get_collection_name()),
+                num_documents=len(group),
+                total_content_len=sum(len(clean_model.content) for clean_model in cleaned_group),
+            )
+
+        return clean_models
+
 # A dispatcher inputs a document and applies dedicated handlers based on its data category (article, post, or repository). A handler can either clean, chunk, or embed a document.
 # The ChunkingDispatcher implements a dispatch() method that inputs a raw document. Based on its data category, 
 # it instantiates and calls a handler that applies the chunking logic specific to that data point.
-# The key in the dispatcher logic is the ChunkingHandlerFactory(), which instantiates a different chunking handler based on the document’s data category:
+# The key in the dispatcher logic is the ChunkingHandlerFactory(), which resolves a different chunking handler based on the document’s data category.
+# Like the cleaning handlers, these are stateless singletons built once at import time:
+_CHUNKING_HANDLERS: dict[DataCategory, ChunkingDataHandler] = {
+    DataCategory.POSTS: PostChunkingHandler(),
+    DataCategory.ARTICLES: ArticleChunkingHandler(),
+    DataCategory.REPOSITORIES: RepositoryChunkingHandler(),
+}
+
+# The same singletons, bound directly to the cleaned document classes they handle:
+_CHUNKING_HANDLER_BY_CLASS: dict[type[VectorBaseDocument], ChunkingDataHandler] = {
+    CleanedPostDocument: _CHUNKING_HANDLERS[DataCategory.POSTS],
+    CleanedArticleDocument: _CHUNKING_HANDLERS[DataCategory.ARTICLES],
+    CleanedRepositoryDocument: _CHUNKING_HANDLERS[DataCategory.REPOSITORIES],
+}
+
+
+# Kept as a shim for callers that still resolve handlers by data category:
 class ChunkingHandlerFactory:
     @staticmethod
     def create_handler(data_category: DataCategory) -> ChunkingDataHandler:
-        if data_category == DataCategory.POSTS:
-            return PostChunkingHandler()
-        elif data_category == DataCategory.ARTICLES:
-            return ArticleChunkingHandler()
-        elif data_category == DataCategory.REPOSITORIES:
-            return RepositoryChunkingHandler()
-        else:
-            raise ValueError("Unsupported data type")
+        try:
+            return _CHUNKING_HANDLERS[data_category]
+        except KeyError:
+            raise ValueError("Unsupported data type") from None
 
 
 class ChunkingDispatcher:
@@ -79,14 +147,17 @@ class ChunkingDispatcher:
 
     @classmethod
     def dispatch(cls, data_model: VectorBaseDocument) -> list[VectorBaseDocument]:
-        data_category = data_model.get_category()
-        handler = cls.factory.create_handler(data_category)
+        handler = _CHUNKING_HANDLER_BY_CLASS.get(type(data_model))
+        if handler is None:
+            raise ValueError("Unsupported data type")
+
         chunk_models = handler.chunk(data_model)
 
-        logger.info(
+        # Per-document logs are debug-only to keep record formatting off the hot path:
+        logger.debug(
             "Document chunked successfully.",
             num=len(chunk_models),
-            data_category=data_category,
+            data_category=data_model.get_category(),
         )
 
         return chunk_models
@@ -94,50 +165,76 @@ class ChunkingDispatcher:
 # A dispatcher inputs a document and applies dedicated handlers based on its data category (article, post, or repository). A handler can either clean, chunk, or embed a document.
 # The EmbeddingDispatcher implements a dispatch() method that inputs a raw document. Based on its data category, 
 # it instantiates and calls a handler that applies the embedding logic specific to that data point.
-# The key in the dispatcher logic is the EmbeddingHandlerFactory(), which instantiates a different embedding handler based on the document’s data category:
+# The key in the dispatcher logic is the EmbeddingHandlerFactory(), which resolves a different embedding handler based on the document’s data category.
+# Like the cleaning and chunking handlers, these are stateless singletons built once at import time:
+_EMBEDDING_HANDLERS: dict[DataCategory, EmbeddingDataHandler] = {
+    DataCategory.QUERIES: QueryEmbeddingHandler(),
+    DataCategory.POSTS: PostEmbeddingHandler(),
+    DataCategory.ARTICLES: ArticleEmbeddingHandler(),
+    DataCategory.REPOSITORIES: RepositoryEmbeddingHandler(),
+}
+
+# The same singletons, bound directly to the chunk/query classes they handle:
+_EMBEDDING_HANDLER_BY_CLASS: dict[type[VectorBaseDocument], EmbeddingDataHandler] = {
+    Query: _EMBEDDING_HANDLERS[DataCategory.QUERIES],
+    PostChunk: _EMBEDDING_HANDLERS[DataCategory.POSTS],
+    ArticleChunk: _EMBEDDING_HANDLERS[DataCategory.ARTICLES],
+    RepositoryChunk: _EMBEDDING_HANDLERS[DataCategory.REPOSITORIES],
+}
+
+
+# Kept as a shim for callers that still resolve handlers by data category:
 class EmbeddingHandlerFactory:
     @staticmethod
     def create_handler(data_category: DataCategory) -> EmbeddingDataHandler:
-        if data_category == DataCategory.QUERIES:
-            return QueryEmbeddingHandler()
-        if data_category == DataCategory.POSTS:
-            return PostEmbeddingHandler()
-        elif data_category == DataCategory.ARTICLES:
-            return ArticleEmbeddingHandler()
-        elif data_category == DataCategory.REPOSITORIES:
-            return RepositoryEmbeddingHandler()
-        else:
-            raise ValueError("Unsupported data type")
+        try:
+            return _EMBEDDING_HANDLERS[data_category]
+        except KeyError:
+            raise ValueError("Unsupported data type") from None
 
 
 class EmbeddingDispatcher:
     factory = EmbeddingHandlerFactory
 
+    # The hot path: embeds a homogeneous batch of models in one handler call.
+    # The homogeneity check only runs in debug mode (python -O strips it) — callers like the embedding step
+    # already hand us batches grouped by class, so there is no point scanning the whole batch in production:
     @classmethod
-    def dispatch(
-        cls, data_model: VectorBaseDocument | list[VectorBaseDocument]
-    ) -> VectorBaseDocument | list[VectorBaseDocument]:
-        is_list = isinstance(data_model, list)
-        if not is_list:
-            data_model = [data_model]
-
-        if len(data_model) == 0:
+    def dispatch_batch(cls, data_models: list[VectorBaseDocument]) -> list[VectorBaseDocument]:
+        if len(data_models) == 0:
             return []
 
-        data_category = data_model[0].get_category()
-        assert all(
-            data_model.get_category() == data_category for data_model in data_model
-        ), "Data models must be of the same category."
-        handler = cls.factory.create_handler(data_category)
+        if __debug__:
+            data_category = data_models[0].get_category()
+            assert all(
+                data_model.get_category() == data_category for data_model in data_models
+            ), "Data models must be of the same category."
 
-        embedded_chunk_model = handler.embed_batch(data_model)
+        handler = _EMBEDDING_HANDLER_BY_CLASS.get(type(data_models[0]))
+        if handler is None:
+            raise ValueError("Unsupported data type")
 
-        if not is_list:
-            embedded_chunk_model = embedded_chunk_model[0]
+        embedded_chunk_models = handler.embed_batch(data_models)
 
         logger.info(
             "Data embedded successfully.",
-            data_category=data_category,
+            data_category=data_models[0].get_category(),
+            num=len(embedded_chunk_models),
         )
 
-        return embedded_chunk_model
\ No newline at end of file
+        return embedded_chunk_models
+
+    @classmethod
+    def dispatch_one(cls, data_model: VectorBaseDocument) -> VectorBaseDocument:
+        return cls.dispatch_batch([data_model])[0]
+
+    # Thin adaptor kept for callers that mix single models and lists; hot callers should
+    # use dispatch_batch/dispatch_one directly and skip the isinstance indirection:
+    @classmethod
+    def dispatch(
+        cls, data_model: VectorBaseDocument | list[VectorBaseDocument]
+    ) -> VectorBaseDocument | list[VectorBaseDocument]:
+        if isinstance(data_model, list):
+            return cls.dispatch_batch(data_model)
+
+        return cls.dispatch_one(data_model)
\ No newline at end of file
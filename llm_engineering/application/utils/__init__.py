@@ -1,3 +1,4 @@
+from . import misc
 from .split_user_full_name import split_user_full_name
 
-__all__ = ["split_user_full_name"]
\ No newline at end of file
+__all__ = ["misc", "split_user_full_name"]
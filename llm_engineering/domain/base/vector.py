@@ -15,9 +15,16 @@ from llm_engineering.domain.exceptions import ImproperlyConfigured
 from llm_engineering.domain.types import DataCategory
 # All operations made to Qdrant will be done through the connection instance, which is instantiated in the application’s infrastructure layer
 from llm_engineering.infrastructure.db.qdrant import connection
+from llm_engineering.settings import settings
 
 T = TypeVar("T", bound="VectorBaseDocument")
 
+# Data categories and collection names resolved by get_category()/get_collection_name(), cached per document class.
+# Both methods are called at least once per document on the dispatch paths, so the hasattr checks
+# and attribute walks shouldn't be repeated per call:
+_CATEGORY_CACHE: dict[type, DataCategory] = {}
+_COLLECTION_NAME_CACHE: dict[type, str] = {}
+
 
 # The VectorBaseDocument class inherits from Pydantic’s BaseModel and helps us structure a single record’s attributes from the vector DB. 
 # Every OVM will be initialized by default with UUID4 as its unique identifier. 
@@ -99,7 +106,12 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
                 f"Collection '{cls.get_collection_name()}' does not exist. Trying to create the collection and reinsert the documents."
             )
 
-            cls.create_collection()
+            try:
+                cls.create_collection()
+            except exceptions.UnexpectedResponse:
+                # Batches are inserted concurrently, so another batch may have created the collection
+                # between our failed insert and this call. Fall through and retry the insert against it.
+                pass
 
             try:
                 cls._bulk_insert(documents)
@@ -214,24 +226,45 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
     @classmethod
     def get_category(cls: Type[T]) -> DataCategory:
+        cached = _CATEGORY_CACHE.get(cls)
+        if cached is not None:
+            return cached
+
         if not hasattr(cls, "Config") or not hasattr(cls.Config, "category"):
             raise ImproperlyConfigured(
                 "The class should define a Config class with"
                 "the 'category' property that reflects the collection's data category."
             )
 
+        _CATEGORY_CACHE[cls] = cls.Config.category
+
         return cls.Config.category
 
     # The collection name is inferred from the Config class defined in the subclasses inheriting the OVM:
     @classmethod
     def get_collection_name(cls: Type[T]) -> str:
+        cached = _COLLECTION_NAME_CACHE.get(cls)
+        if cached is not None:
+            return cached
+
         if not hasattr(cls, "Config") or not hasattr(cls.Config, "name"):
             raise ImproperlyConfigured(
                 "The class should define a Config class with" "the 'name' property that reflects the collection's name."
             )
 
+        _COLLECTION_NAME_CACHE[cls] = cls.Config.name
+
         return cls.Config.name
 
+    # The bulk insertion batch size can be tuned per collection through the Config class.
+    # When a subclass doesn't care, it inherits the global default from the settings:
+    @classmethod
+    def get_bulk_batch_size(cls: Type[T]) -> int:
+        if not hasattr(cls, "Config") or not hasattr(cls.Config, "bulk_batch_size"):
+            return settings.VECTOR_DB_BULK_BATCH_SIZE
+
+        return cls.Config.bulk_batch_size
+
     @classmethod
     def get_use_vector_index(cls: Type[T]) -> bool:
         if not hasattr(cls, "Config") or not hasattr(cls.Config, "use_vector_index"):
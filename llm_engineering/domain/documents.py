@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import UUID4, Field
 
 from .base import NoSQLBaseDocument # TODO - implement
+from .exceptions import LLMTwinException
 from .types import DataCategory
 
 # The UserDocument class is used to store and query all the users from the LLM Twin project:
@@ -18,6 +19,32 @@ class UserDocument(NoSQLBaseDocument):
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
+    # Resolves many users at once: one find() with an $or clause fetches every existing user,
+    # and one bulk_insert() creates all the missing ones — two round trips to the database
+    # instead of a find_one()/insert_one() pair per user. Returns the users in the order of the input pairs:
+    @classmethod
+    def bulk_get_or_create(cls, pairs: list[tuple[str, str]]) -> list["UserDocument"]:
+        if not pairs:
+            return []
+
+        or_clause = [{"first_name": first_name, "last_name": last_name} for first_name, last_name in pairs]
+        existing = cls.bulk_find(**{"$or": or_clause})
+
+        found = {(user.first_name, user.last_name) for user in existing}
+        missing = [
+            cls(first_name=first_name, last_name=last_name)
+            for first_name, last_name in dict.fromkeys(pairs)
+            if (first_name, last_name) not in found
+        ]
+        # Like get_or_create(), resolution must fail loudly: returning users that were never persisted
+        # would make the downstream per-author warehouse queries quietly come back empty.
+        if missing and not cls.bulk_insert(missing):
+            raise LLMTwinException(f"Failed to insert {len(missing)} missing users.")
+
+        users_by_name = {(user.first_name, user.last_name): user for user in existing + missing}
+
+        return [users_by_name[pair] for pair in pairs]
+
 # The Document class is introduced as an abstract base model for other documents on top of the NoSQLBaseDocument ODM class. 
 # It includes common attributes like content, platform, and author details, providing a standardized structure for documents that will inherit from it
 # By leveraging Pydantic to define the fields, we have out-of-the-box type validation    
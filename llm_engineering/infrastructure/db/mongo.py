@@ -11,7 +11,18 @@ class MongoDatabaseConnector:
     def __new__(cls, *args, **kwargs) -> MongoClient:
         if cls._instance is None:
             try:
-                cls._instance = MongoClient(settings.DATABASE_HOST)
+                # The bulk read/write paths issue many concurrent requests, so the pool is sized well above
+                # pymongo's default of 100. Wire compression shrinks the payloads — the text-heavy content
+                # fields compress well — with zstd preferred and snappy as a fallback; pymongo silently skips
+                # compressors whose library isn't installed on the client:
+                cls._instance = MongoClient(
+                    settings.DATABASE_HOST,
+                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                    compressors="zstd,snappy",
+                    w=1,
+                    retryWrites=True,
+                )
             except ConnectionFailure as e:
                 logger.error(f"Couldn't connect to the database: {e!s}")
 
@@ -1,13 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 from typing_extensions import Annotated
 from zenml import step
 
 from llm_engineering.application import utils
 from llm_engineering.domain.base import VectorBaseDocument
+from llm_engineering.settings import settings
 
 
-# As each article, post, or code repository sits in a different collection inside the vector DB, 
-# we have to group all the documents based on their data category. Then, we load each group in bulk in the Qdrant vector DB
+# As each article, post, or code repository sits in a different collection inside the vector DB,
+# we have to group all the documents based on their data category. Then, we load each group in bulk in the Qdrant vector DB.
+# Loading is bound by network round trips, not CPU, so we insert large batches (tunable globally or per collection through
+# get_bulk_batch_size()) and keep a few of them in flight at once on a thread pool — the DB client releases the GIL on the wire.
 @step
 def load_to_vector_db(
     documents: Annotated[list, "documents"],
@@ -15,14 +20,24 @@ def load_to_vector_db(
     logger.info(f"Loading {len(documents)} documents into the vector database.")
 
     grouped_documents = VectorBaseDocument.group_by_class(documents)
-    for document_class, documents in grouped_documents.items():
+    for document_class, class_documents in grouped_documents.items():
         logger.info(f"Loading documents into {document_class.get_collection_name()}")
-        for documents_batch in utils.misc.batch(documents, size=4):
-            try:
-                document_class.bulk_insert(documents_batch)
-            except Exception:
-                logger.error(f"Failed to insert documents into {document_class.get_collection_name()}")
+        batches = utils.misc.batch(class_documents, size=document_class.get_bulk_batch_size())
+        try:
+            # Make sure the collection exists before fanning out, so a cold start doesn't send every
+            # in-flight batch through bulk_insert's create-and-retry recovery path at once:
+            document_class.get_or_create_collection()
+
+            with ThreadPoolExecutor(max_workers=settings.VECTOR_DB_BULK_CONCURRENCY) as executor:
+                insertions = list(executor.map(document_class.bulk_insert, batches))
+        except Exception:
+            logger.error(f"Failed to insert documents into {document_class.get_collection_name()}")
+
+            return False
+
+        if not all(insertions):
+            logger.error(f"Failed to insert documents into {document_class.get_collection_name()}")
 
-                return False
+            return False
 
-    return True
\ No newline at end of file
+    return True
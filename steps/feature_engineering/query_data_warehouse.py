@@ -1,7 +1,10 @@
 # Using threads to parallelize I/O-bounded calls is good practice in Python, as they are not locked by the Python Global Interpreter Lock (GIL). 
 # In contrast, adding each call to a different process would add too much overhead, as a process takes longer to spin off than a thread.
 # In Python, you want to parallelize things with processes only when the operations are CPU or memory-bound because the GIL affects them
+import itertools
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator
 
 from loguru import logger
 from typing_extensions import Annotated
@@ -11,26 +14,36 @@ from llm_engineering.application import utils
 from llm_engineering.domain.base.nosql import NoSQLBaseDocument
 from llm_engineering.domain.documents import ArticleDocument, Document, PostDocument, RepositoryDocument, UserDocument
 
-# Attempts to get or create a UserDocument instance using the first and last names, appending this instance to the authors list. If the user doesn’t exist, it throws an error
+# Gets or creates the UserDocument instances for all the author names in one bulk call. If a user can't be resolved, it throws an error
 # Fetches all the raw data for the user from the data warehouse and extends the documents list to include these user documents
 # Computes a descriptive metadata dictionary logged and tracked in ZenML
 def query_data_warehouse(
     author_full_names: list[str],
 ) -> Annotated[list, "raw_documents"]:
-    documents = []
-    authors = []
-    for author_full_name in author_full_names:
-        logger.info(f"Querying data warehouse for user: {author_full_name}")
+    _ensure_author_id_indexes()
+
+    # All the users are resolved up front in one bulk call — two round trips to the database
+    # instead of a find_one()/insert_one() pair per author:
+    name_pairs = [utils.split_user_full_name(author_full_name) for author_full_name in author_full_names]
+    authors = UserDocument.bulk_get_or_create(name_pairs)
 
-        first_name, last_name = utils.split_user_full_name(author_full_name)
-        logger.info(f"First name: {first_name}, Last name: {last_name}")
-        user = UserDocument.get_or_create(first_name=first_name, last_name=last_name)
-        authors.append(user)
+    # The per-author fetches are I/O bound on the data warehouse, so instead of looping over the authors
+    # serially (latency = sum over authors), all of them are submitted to one outer thread pool
+    # (latency ~ the slowest author). Each worker drives its author's lazy cursors to completion,
+    # so at any moment only cursor-sized chunks of raw documents are in flight per author:
+    documents = []
+    with ThreadPoolExecutor(max_workers=min(32, max(len(authors), 1))) as executor:
+        future_to_author = {executor.submit(_fetch_user_documents, user): user for user in authors}
+        for future in as_completed(future_to_author):
+            user = future_to_author[future]
+            try:
+                documents.extend(future.result())
+            except Exception:
+                logger.exception(f"Fetching raw documents for user '{user.full_name}' failed.")
 
-        results = fetch_all_data(user)
-        user_documents = [doc for query_result in results.values() for doc in query_result]
+                continue
 
-        documents.extend(user_documents)
+            logger.info(f"Fetched all raw documents for user: {user.full_name}")
 
     step_context = get_step_context()
     step_context.add_output_metadata(output_name="raw_documents", metadata=_get_metadata(documents))
@@ -38,62 +51,76 @@ def query_data_warehouse(
     return documents
 
 
-# The fetch function leverages a thread pool that runs each query on a different thread. As we have multiple data categories, 
-# we have to make a different query for the articles, posts, and repositories, as they are stored in different collections. 
-# Each query calls the data warehouse, which is bounded by the network I/O and data warehouse latency, not by the machine’s CPU. 
-# Thus, by moving each query to a different thread, we can parallelize them. Ultimately, instead of adding the latency of each query as the total timing, 
-# the time to run this fetch function will be the max between all the calls. 
-def fetch_all_data(user: UserDocument) -> dict[str, list[NoSQLBaseDocument]]:
+# Runs inside an outer thread pool worker: drains one author's lazy cursors into a list.
+# Only the parsed documents accumulate — the raw MongoDB dicts are discarded one cursor batch at a time:
+def _fetch_user_documents(user: UserDocument) -> list[NoSQLBaseDocument]:
+    results = fetch_all_data(user)
+
+    return list(itertools.chain.from_iterable(results.values()))
+
+
+# As we have multiple data categories, we have to make a different query for the articles, posts, and repositories,
+# as they are stored in different collections. The cursors returned here are lazy: nothing is fetched from the
+# data warehouse until a caller iterates them, and then pymongo hydrates the documents in cursor-sized batches
+# instead of materializing every document of the author at once:
+def fetch_all_data(user: UserDocument) -> dict[str, Iterable[NoSQLBaseDocument]]:
     user_id = str(user.id)
-    with ThreadPoolExecutor() as executor:
-        future_to_query = {
-            executor.submit(__fetch_articles, user_id): "articles",
-            executor.submit(__fetch_posts, user_id): "posts",
-            executor.submit(__fetch_repositories, user_id): "repositories",
-        }
 
-        results = {}
-        for future in as_completed(future_to_query):
-            query_name = future_to_query[future]
-            try:
-                results[query_name] = future.result()
-            except Exception:
-                logger.exception(f"'{query_name}' request failed.")
+    return {
+        "articles": __fetch_articles(user_id),
+        "posts": __fetch_posts(user_id),
+        "repositories": __fetch_repositories(user_id),
+    }
+
+
+# The downstream cleaning handlers only touch these fields, so we project the queries down to them.
+# MongoDB then skips the unused field bytes both on disk and over the wire:
+_RAW_DOCUMENT_PROJECTION = {
+    "content": 1,
+    "platform": 1,
+    "author_id": 1,
+    "author_full_name": 1,
+    "link": 1,
+    "name": 1,
+    "image": 1,
+}
 
-                results[query_name] = []
 
-    return results
+# Every fetch below filters on author_id, so make sure each collection has an index on it.
+# create_index is idempotent, turning this into a cheap no-op once the indexes exist:
+def _ensure_author_id_indexes() -> None:
+    for document_class in (ArticleDocument, PostDocument, RepositoryDocument):
+        document_class.create_index("author_id")
 
 
-def __fetch_articles(user_id) -> list[NoSQLBaseDocument]:
-    return ArticleDocument.bulk_find(author_id=user_id)
+def __fetch_articles(user_id) -> Iterator[NoSQLBaseDocument]:
+    return ArticleDocument.bulk_iter(author_id=user_id, projection=_RAW_DOCUMENT_PROJECTION)
 
 
-def __fetch_posts(user_id) -> list[NoSQLBaseDocument]:
-    return PostDocument.bulk_find(author_id=user_id)
+def __fetch_posts(user_id) -> Iterator[NoSQLBaseDocument]:
+    return PostDocument.bulk_iter(author_id=user_id, projection=_RAW_DOCUMENT_PROJECTION)
 
 
-def __fetch_repositories(user_id) -> list[NoSQLBaseDocument]:
-    return RepositoryDocument.bulk_find(author_id=user_id)
+def __fetch_repositories(user_id) -> Iterator[NoSQLBaseDocument]:
+    return RepositoryDocument.bulk_iter(author_id=user_id, projection=_RAW_DOCUMENT_PROJECTION)
 
 
-# Takes the list of queried documents and authors and counts the number of them relative to each data category:
+# Takes the list of queried documents and counts the number of them relative to each data category.
+# Counts and author sets are accumulated in a single pass — a set deduplicates the authors as we go,
+# so there is no per-collection list to build and deduplicate afterwards:
 def _get_metadata(documents: list[Document]) -> dict:
-    metadata = {
-        "num_documents": len(documents),
-    }
+    counts = Counter()
+    authors = defaultdict(set)
     for document in documents:
         collection = document.get_collection_name()
-        if collection not in metadata:
-            metadata[collection] = {}
-        if "authors" not in metadata[collection]:
-            metadata[collection]["authors"] = list()
-
-        metadata[collection]["num_documents"] = metadata[collection].get("num_documents", 0) + 1
-        metadata[collection]["authors"].append(document.author_full_name)
-
-    for value in metadata.values():
-        if isinstance(value, dict) and "authors" in value:
-            value["authors"] = list(set(value["authors"]))
+        counts[collection] += 1
+        authors[collection].add(document.author_full_name)
+
+    metadata = {"num_documents": len(documents)}
+    for collection, num_documents in counts.items():
+        metadata[collection] = {
+            "num_documents": num_documents,
+            "authors": list(authors[collection]),
+        }
 
     return metadata
\ No newline at end of file
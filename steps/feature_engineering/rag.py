@@ -2,9 +2,14 @@ from typing_extensions import Annotated
 from zenml import get_step_context, step
 
 from llm_engineering.application import utils
+from llm_engineering.application.networks import EmbeddingModelSingleton
 from llm_engineering.application.preprocessing import ChunkingDispatcher, EmbeddingDispatcher
 from llm_engineering.domain.chunks import Chunk
 from llm_engineering.domain.embedded_chunks import EmbeddedChunk
+from llm_engineering.settings import settings
+
+# The same singleton instance (and thread-safe fast tokenizer) the embedding handlers already load:
+embedding_model = EmbeddingModelSingleton()
 
 
 # Similar to how we cleaned the documents, we delegate the chunking and embedding logic to a dispatcher who knows how to handle each data category. 
@@ -20,8 +25,13 @@ def chunk_and_embed(
         chunks = ChunkingDispatcher.dispatch(document)
         metadata["chunking"] = _add_chunks_metadata(chunks, metadata["chunking"])
 
-        for batched_chunks in utils.misc.batch(chunks, 10):
-            batched_embedded_chunks = EmbeddingDispatcher.dispatch(batched_chunks)
+        # The chunks of one document all share a class, so we can go straight to the batch path.
+        # Batches are sized by summed token count rather than chunk count — fixed-count batches of short
+        # chunks waste the embedding model's compute on padding:
+        for batched_chunks in utils.misc.token_batch(
+            chunks, embedding_model.tokenizer, max_tokens=settings.EMBED_MAX_TOKENS_PER_BATCH
+        ):
+            batched_embedded_chunks = EmbeddingDispatcher.dispatch_batch(batched_chunks)
             embedded_chunks.extend(batched_embedded_chunks)
 
     metadata["embedding"] = _add_embeddings_metadata(embedded_chunks, metadata["embedding"])